@@ -165,6 +165,9 @@ class CommandPathPost:
 
         return filename
 
+    def clearanceCommand(self, job):
+        return Path.Command("G0", {"Z": job.Stock.Shape.BoundBox.ZMax + job.SetupSheet.ClearanceHeightOffset.Value})
+
     def resolvePostProcessor(self, job):
         if hasattr(job, "PostProcessor"):
             post = PathPreferences.defaultPostProcessor()
@@ -265,6 +268,10 @@ class CommandPathPost:
         orderby = job.OrderOutputBy
         split = job.SplitOutput
 
+        # the clearance move between fixtures is identical for all of them,
+        # it's built when first needed because not every job has stock
+        clearance = None
+
         postlist = []
 
         if orderby == 'Fixture':
@@ -279,8 +286,9 @@ class CommandPathPost:
                 c1 = Path.Command(f)
                 fobj.Path = Path.Path([c1])
                 if index != 0:
-                    c2 = Path.Command("G0 Z" + str(job.Stock.Shape.BoundBox.ZMax + job.SetupSheet.ClearanceHeightOffset.Value))
-                    fobj.Path.addCommands(c2)
+                    if clearance is None:
+                        clearance = self.clearanceCommand(job)
+                    fobj.Path.addCommands(clearance)
                 fobj.InList.append(job)
                 sublist = [fobj]
 
@@ -307,8 +315,9 @@ class CommandPathPost:
                 # create an object to serve as the fixture path
                 fobj = _TempObject()
                 c1 = Path.Command(f)
-                c2 = Path.Command("G0 Z" + str(job.Stock.Shape.BoundBox.ZMax + job.SetupSheet.ClearanceHeightOffset.Value))
-                fobj.Path = Path.Path([c1, c2])
+                if clearance is None:
+                    clearance = self.clearanceCommand(job)
+                fobj.Path = Path.Path([c1, clearance])
                 fobj.InList.append(job)
                 fixturelist.append(fobj)
 
@@ -360,8 +369,9 @@ class CommandPathPost:
                         c1 = Path.Command(f)
                         fobj.Path = Path.Path([c1])
                         if not firstFixture:
-                            c2 = Path.Command("G0 Z" + str(job.Stock.Shape.BoundBox.ZMax + job.SetupSheet.ClearanceHeightOffset.Value))
-                            fobj.Path.addCommands(c2)
+                            if clearance is None:
+                                clearance = self.clearanceCommand(job)
+                            fobj.Path.addCommands(clearance)
                         fobj.InList.append(job)
                         sublist.append(fobj)
                         firstFixture = False
@@ -210,8 +210,11 @@ def setPostProcessorDefaults(processor, args, blacklist):
 
 def setOutputFileDefaults(fileName, policy):
     pref = preferences()
-    pref.SetString(PostProcessorOutputFile, fileName)
-    pref.SetString(PostProcessorOutputPolicy, policy)
+    # only write values which actually changed, no need to notify observers otherwise
+    if pref.GetString(PostProcessorOutputFile, "") != fileName:
+        pref.SetString(PostProcessorOutputFile, fileName)
+    if pref.GetString(PostProcessorOutputPolicy, "") != policy:
+        pref.SetString(PostProcessorOutputPolicy, policy)
 
 
 def defaultOutputFile():
@@ -52,8 +52,8 @@ class GCodeHighlighter(QtGui.QSyntaxHighlighter):
         self.highlightingRules.append((QtCore.QRegExp("\\bF[0-9\\.]+\\b"),speedFormat))
 
     def highlightBlock(self, text):
-        for pattern, hlFormat in self.highlightingRules:
-            expression = QtCore.QRegExp(pattern)
+        # the rules hold already compiled expressions, no need to copy them for every block
+        for expression, hlFormat in self.highlightingRules:
             index = expression.indexIn(text)
             while index >= 0:
                 length = expression.matchedLength()
@@ -63,6 +63,8 @@ class GCodeHighlighter(QtGui.QSyntaxHighlighter):
 
 
 class GCodeEditorDialog(QtGui.QDialog):
+    editorFont = None  # shared by all instances, created with the first dialog
+
     def __init__(self, parent = None):
         if parent is None:
             parent = FreeCADGui.getMainWindow()
@@ -72,11 +74,13 @@ class GCodeEditorDialog(QtGui.QDialog):
 
         # nice text editor widget for editing the gcode
         self.editor = QtGui.QTextEdit()
-        font = QtGui.QFont()
-        font.setFamily("Courier")
-        font.setFixedPitch(True)
-        font.setPointSize(10)
-        self.editor.setFont(font)
+        if GCodeEditorDialog.editorFont is None:
+            font = QtGui.QFont()
+            font.setFamily("Courier")
+            font.setFixedPitch(True)
+            font.setPointSize(10)
+            GCodeEditorDialog.editorFont = font
+        self.editor.setFont(GCodeEditorDialog.editorFont)
         self.editor.setText("G01 X55 Y4.5 F300.0")
         layout.addWidget(self.editor)
 
@@ -141,7 +145,7 @@ def editor(gcode):
 
     dia = GCodeEditorDialog()
     dia.editor.setText(gcode)
-    gcodeSize = len(dia.editor.toPlainText())
+    gcodeSize = len(gcode)
     if (gcodeSize <= mhs):
         # because of poor performance, syntax highlighting is
         # limited to mhs octets (default 512 KB).
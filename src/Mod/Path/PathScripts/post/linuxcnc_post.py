@@ -169,6 +169,10 @@ def export(objectslist, filename, argstring):
     print("postprocessing...")
     gcode = ""
 
+    # the operation blocks are inserted for every operation, split them only once
+    preOperationLines = PRE_OPERATION.splitlines(True)
+    postOperationLines = POST_OPERATION.splitlines(True)
+
     # write header
     if OUTPUT_HEADER:
         gcode += linenumber() + "(Exported by FreeCAD)\n"
@@ -196,7 +200,7 @@ def export(objectslist, filename, argstring):
         if OUTPUT_COMMENTS:
             gcode += linenumber() + "(begin operation: %s)\n" % obj.Label
             gcode += linenumber() + "(machine units: %s)\n" % (UNIT_SPEED_FORMAT)
-        for line in PRE_OPERATION.splitlines(True):
+        for line in preOperationLines:
             gcode += linenumber() + line
 
         # get coolant mode
@@ -222,7 +226,7 @@ def export(objectslist, filename, argstring):
         # do the post_op
         if OUTPUT_COMMENTS:
             gcode += linenumber() + "(finish operation: %s)\n" % obj.Label
-        for line in POST_OPERATION.splitlines(True):
+        for line in postOperationLines:
             gcode += linenumber() + line
 
         # turn coolant off if required
@@ -277,10 +281,22 @@ def parse(pathobj):
     global UNIT_FORMAT
     global UNIT_SPEED_FORMAT
 
-    out = ""
+    out = []  # collect the output lines and join them once at the end
     lastcommand = None
     precision_string = '.' + str(PRECISION) + 'f'
     currLocation = {}  # keep track for no doubles
+    toolChangeLines = TOOL_CHANGE.splitlines(True)
+    lengthCache = {}  # coordinates repeat a lot, only convert and format them once
+
+    def formatLength(value):
+        # -0.0 == 0.0 but they don't format the same, so zero is never cached
+        formatted = lengthCache.get(value) if value else None
+        if formatted is None:
+            pos = Units.Quantity(value, FreeCAD.Units.Length)
+            formatted = format(float(pos.getValueAs(UNIT_FORMAT)), precision_string)
+            if value:
+                lengthCache[value] = formatted
+        return formatted
 
     # the order of parameters
     # linuxcnc doesn't want K properties on XY plane  Arcs need work.
@@ -292,13 +308,13 @@ def parse(pathobj):
         # if OUTPUT_COMMENTS:
         #     out += linenumber() + "(compound: " + pathobj.Label + ")\n"
         for p in pathobj.Group:
-            out += parse(p)
-        return out
+            out.append(parse(p))
+        return "".join(out)
     else:  # parsing simple path
 
         # groups might contain non-path things like stock.
         if not hasattr(pathobj, "Path"):
-            return out
+            return ""
 
         # if OUTPUT_COMMENTS:
         #     out += linenumber() + "(" + pathobj.Label + ")\n"
@@ -320,7 +336,7 @@ def parse(pathobj):
             # Now add the remaining parameters in order
             for param in params:
                 if param in c.Parameters:
-                    if param == 'F' and (currLocation[param] != c.Parameters[param] or OUTPUT_DOUBLES):
+                    if param == 'F' and (OUTPUT_DOUBLES or currLocation[param] != c.Parameters[param]):
                         if c.Name not in ["G0", "G00"]:  # linuxcnc doesn't use rapid speeds
                             speed = Units.Quantity(c.Parameters['F'], FreeCAD.Units.Velocity)
                             if speed.getValueAs(UNIT_SPEED_FORMAT) > 0.0:
@@ -339,9 +355,7 @@ def parse(pathobj):
                         if (not OUTPUT_DOUBLES) and (param in currLocation) and (currLocation[param] == c.Parameters[param]):
                             continue
                         else:
-                            pos = Units.Quantity(c.Parameters[param], FreeCAD.Units.Length)
-                            outstring.append(
-                                param + format(float(pos.getValueAs(UNIT_FORMAT)), precision_string))
+                            outstring.append(param + formatLength(c.Parameters[param]))
 
             # store the latest command
             lastcommand = command
@@ -350,9 +364,9 @@ def parse(pathobj):
             # Check for Tool Change:
             if command == 'M6':
                 # stop the spindle
-                out += linenumber() + "M5\n"
-                for line in TOOL_CHANGE.splitlines(True):
-                    out += linenumber() + line
+                out.append(linenumber() + "M5\n")
+                for line in toolChangeLines:
+                    out.append(linenumber() + line)
 
                 # add height offset
                 if USE_TLO:
@@ -361,7 +375,7 @@ def parse(pathobj):
 
             if command == "message":
                 if OUTPUT_COMMENTS is False:
-                    out = []
+                    continue
                 else:
                     outstring.pop(0)  # remove the command
 
@@ -371,12 +385,8 @@ def parse(pathobj):
                     outstring.insert(0, (linenumber()))
 
                 # append the line to the final output
-                for w in outstring:
-                    out += w + COMMAND_SPACE
-                # Note: Do *not* strip `out`, since that forces the allocation
-                # of a contiguous string & thus quadratic complexity.
-                out += "\n"
+                out.append(COMMAND_SPACE.join(outstring) + COMMAND_SPACE + "\n")
 
-        return out
+        return "".join(out)
 
 # print(__name__ + " gcode postprocessor loaded.")
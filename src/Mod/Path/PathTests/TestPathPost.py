@@ -21,6 +21,7 @@
 # ***************************************************************************
 
 import FreeCAD
+import Path
 import PathScripts
 import PathScripts.post
 import PathScripts.PathProfileContour
@@ -29,6 +30,7 @@ import PathScripts.PathPost
 import PathScripts.PathToolController
 import PathScripts.PathUtil
 import difflib
+import importlib
 import unittest
 
 WriteDebugOutput = False
@@ -105,3 +107,31 @@ class PathPostTestCases(unittest.TestCase):
         if gcode != refGCode:
             msg = ''.join(difflib.ndiff(gcode.splitlines(True), refGCode.splitlines(True)))
             self.fail("linuxcnc output doesn't match: " + msg)
+
+
+class LinuxCNCPostTestCases(unittest.TestCase):
+
+    def setUp(self):
+        from PathScripts.post import linuxcnc_post
+        # the post keeps its settings in module globals, start from the defaults
+        self.postprocessor = importlib.reload(linuxcnc_post)
+
+    def testMessageWithoutComments(self):
+        # Path.Command can't carry the lower case 'message' name, hence the stand-ins
+        class Message(object):
+            Name = 'message'
+            Parameters = {}
+
+        class Toolpath(object):
+            Commands = [Path.Command('G0', {'X': 1, 'Y': 2, 'Z': 3}), Message()]
+
+        class PathObject(object):
+            Label = 'op'
+            Path = Toolpath()
+
+        args = '--no-header --no-comments --no-show-editor --precision=2'
+        gcode = self.postprocessor.export([PathObject()], '-', args)
+
+        self.assertIsNotNone(gcode)
+        self.assertNotIn('message', gcode)
+        self.assertIn('G0 X1.00 Y2.00 Z3.00', gcode)